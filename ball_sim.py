@@ -2,6 +2,7 @@
 """GPU-accelerated particle physics simulation."""
 
 import argparse
+import collections
 import sys
 import time
 from pathlib import Path
@@ -9,30 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / 'simulation'))
 
 from simulation import physics_torch, particle_utils, gpu_setup
-from simulation import visualizer, event_handler, metrics_sampler, config
-
-
-def _hsv_to_rgb(h, s, v):
-    # h in [0,1], s in [0,1], v in [0,1]
-    i = int(h * 6.0)
-    f = (h * 6.0) - i
-    p = v * (1.0 - s)
-    q = v * (1.0 - f * s)
-    t = v * (1.0 - (1.0 - f) * s)
-    i = i % 6
-    if i == 0:
-        r, g, b = v, t, p
-    elif i == 1:
-        r, g, b = q, v, p
-    elif i == 2:
-        r, g, b = p, v, t
-    elif i == 3:
-        r, g, b = p, q, v
-    elif i == 4:
-        r, g, b = t, p, v
-    else:
-        r, g, b = v, p, q
-    return int(r * 255), int(g * 255), int(b * 255)
+from simulation import visualizer, event_handler, metrics_sampler, config, ui_components
 
 
 class BallSimulation:
@@ -89,13 +67,11 @@ class BallSimulation:
             # Use the pygame visualizer (keep renderer simple and stable)
             viz = visualizer.ParticleVisualizer(window_size=config.WINDOW_SIZE)
 
-            clock = pygame.time.Clock()
-            frame_times = []
-            max_frame_history = 10
+            frame_times = collections.deque(maxlen=10)
             
             try:
                 while self.running:
-                    frame_start = time.time()
+                    frame_start = time.perf_counter()
 
                     events = pygame.event.get()
                     # Use the return value from the event handler to decide
@@ -114,12 +90,7 @@ class BallSimulation:
                     self.gravity_strength = slider_values['gravity']
                     self.small_ball_speed = slider_values['small_ball_speed']
                     self.initial_balls = int(slider_values['initial_balls'])
-
-                    try:
-                        max_cap_text = viz.get_max_balls_cap()
-                        self.max_balls_cap = int(max_cap_text) if max_cap_text.isdigit() else 100000
-                    except:
-                        self.max_balls_cap = 100000
+                    self.max_balls_cap = slider_values['max_balls_cap']
 
                     self.split_enabled = viz.get_split_enabled()
 
@@ -198,13 +169,10 @@ class BallSimulation:
                     render_fps = 0
                     gpu_util = 0
 
-                    positions, masses, colors, glows = self.get_particle_sample(max_samples=2000)
+                    positions, masses, colors, glows = self.get_particle_sample(max_samples=viz.max_render_particles)
 
                     if positions is not None:
-                        frame_time = time.time() - frame_start
-                        frame_times.append(frame_time)
-                        if len(frame_times) > max_frame_history:
-                            frame_times.pop(0)
+                        frame_times.append(time.perf_counter() - frame_start)
                         avg_frame_time = sum(frame_times) / len(frame_times)
                         render_fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
 
@@ -259,7 +227,7 @@ class BallSimulation:
 
                             if r is None:
                                 hue = (time.time() * 0.18) % 1.0
-                                r, g, b = _hsv_to_rgb(hue, 0.72, 0.95)
+                                r, g, b = ui_components.hsv_to_rgb(hue, 0.72, 0.95)
 
                             # ANSI 24-bit color sequence
                             color_seq = f"\x1b[38;2;{r};{g};{b}m"
@@ -281,8 +249,6 @@ class BallSimulation:
                             if not self._terminal_stats_error_printed:
                                 print(f"[DEBUG] terminal printing failed: {e}", file=sys.stderr)
                                 self._terminal_stats_error_printed = True
-
-                    clock.tick()
             except KeyboardInterrupt:
                 # User pressed Ctrl+C — stop cleanly
                 self.running = False
@@ -9,6 +9,8 @@ from . import visualizer
 from . import event_handler
 from . import metrics_sampler
 from . import ui_components
+from . import render_kernels
+from . import controls
 
 __all__ = [
     'physics_torch',
@@ -18,4 +20,6 @@ __all__ = [
     'event_handler',
     'metrics_sampler',
     'ui_components',
+    'render_kernels',
+    'controls',
 ]
@@ -4,8 +4,16 @@ Keep global UI settings here so multiple modules can import the same
 values (window size, defaults) without hardcoding them in several files.
 """
 
+import os
+
 # Default window size used by visualizers
 WINDOW_SIZE = (1600, 1000)
 
-# Default maximum number of particles to render on-screen
-MAX_RENDER_PARTICLES = 2000
+# Default maximum number of particles to render on-screen. Scales with the
+# window's pixel area (2000 at the default size); set SIM_MAX_RENDER_PARTICLES
+# to a positive integer to override.
+MAX_RENDER_PARTICLES = max(500, (WINDOW_SIZE[0] * WINDOW_SIZE[1]) // 800)
+try:
+    MAX_RENDER_PARTICLES = max(1, int(os.environ.get('SIM_MAX_RENDER_PARTICLES', MAX_RENDER_PARTICLES)))
+except ValueError:
+    pass
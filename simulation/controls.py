@@ -0,0 +1,49 @@
+"""State containers for the visualizer's on-screen controls.
+
+Plain slotted dataclasses so the event handler, the visualizer and
+`ui_components` share one explicit set of fields per widget.
+"""
+
+from dataclasses import dataclass, field
+from typing import Tuple
+
+
+@dataclass(slots=True)
+class Slider:
+    value: float
+    min: float
+    max: float
+    label: str
+    pos: Tuple[int, int] = (0, 0)
+    width: int = 220
+    is_int: bool = False
+    base_max: float = 0.0
+
+
+@dataclass(slots=True)
+class Button:
+    label: str
+    width: int
+    height: int
+    pos: Tuple[int, int] = (0, 0)
+
+
+@dataclass(slots=True)
+class TextInput:
+    label: str
+    value: str
+    width: int
+    height: int
+    pos: Tuple[int, int] = (0, 0)
+    active: bool = False
+    # Used for `int_value` while `value` is empty or not a number
+    int_default: int = 100000
+    # Parsed numeric value; derived from `value`, change both via `set_value`
+    int_value: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        self.set_value(self.value)
+
+    def set_value(self, text):
+        self.value = text
+        self.int_value = int(text) if text.isdigit() else self.int_default
@@ -1,5 +1,7 @@
 """Event handling for particle visualizer UI."""
 
+import math
+
 
 def handle_events(visualizer, pygame_events):
     for event in pygame_events:
@@ -9,7 +11,7 @@ def handle_events(visualizer, pygame_events):
         elif event.type == visualizer.pygame.KEYDOWN:
             if event.key == visualizer.pygame.K_ESCAPE:
                 return False
-            elif visualizer.max_balls_cap['active']:
+            elif visualizer.max_balls_cap.active:
                 if not _handle_text_input(visualizer, event):
                     continue
         
@@ -18,8 +20,9 @@ def handle_events(visualizer, pygame_events):
                 _handle_mouse_click(visualizer, event.pos)
         
         elif event.type == visualizer.pygame.MOUSEBUTTONUP:
-            if event.button == 1:
+            if event.button == 1 and visualizer.dragging_slider:
                 visualizer.dragging_slider = None
+                visualizer._ui_dirty = True
         
         elif event.type == visualizer.pygame.MOUSEMOTION:
             if visualizer.dragging_slider:
@@ -29,23 +32,24 @@ def handle_events(visualizer, pygame_events):
 
 
 def _handle_text_input(visualizer, event):
+    visualizer._ui_dirty = True
     if event.key == visualizer.pygame.K_RETURN:
         try:
-            max_cap = int(visualizer.max_balls_cap['value']) if visualizer.max_balls_cap['value'] else 1
-            initial = int(visualizer.sliders['initial_balls']['value']) if 'initial_balls' in visualizer.sliders else 1
+            max_cap = int(visualizer.max_balls_cap.value) if visualizer.max_balls_cap.value else 1
+            initial = int(visualizer.sliders['initial_balls'].value) if 'initial_balls' in visualizer.sliders else 1
             if max_cap < initial:
-                visualizer.max_balls_cap['value'] = str(initial)
+                visualizer.max_balls_cap.set_value(str(initial))
         except ValueError:
-            visualizer.max_balls_cap['value'] = '100000'
-        visualizer.max_balls_cap['active'] = False
+            visualizer.max_balls_cap.set_value('100000')
+        visualizer.max_balls_cap.active = False
     
     elif event.key == visualizer.pygame.K_BACKSPACE:
-        visualizer.max_balls_cap['value'] = visualizer.max_balls_cap['value'][:-1]
+        visualizer.max_balls_cap.set_value(visualizer.max_balls_cap.value[:-1])
     
     elif event.unicode.isdigit():
-        current = visualizer.max_balls_cap['value'] + event.unicode
+        current = visualizer.max_balls_cap.value + event.unicode
         if len(current) <= 6:
-            visualizer.max_balls_cap['value'] = current
+            visualizer.max_balls_cap.set_value(current)
     
     return True
 
@@ -53,32 +57,36 @@ def _handle_text_input(visualizer, event):
 def _handle_mouse_click(visualizer, pos):
     """Handle mouse click events."""
     # Check text input
-    tx, ty = visualizer.max_balls_cap['pos']
-    tw, th = visualizer.max_balls_cap['width'], visualizer.max_balls_cap['height']
+    tx, ty = visualizer.max_balls_cap.pos
+    tw, th = visualizer.max_balls_cap.width, visualizer.max_balls_cap.height
     text_input_clicked = (tx <= pos[0] <= tx + tw and ty <= pos[1] <= ty + th)
     
     if text_input_clicked:
-        visualizer.max_balls_cap['active'] = True
+        visualizer.max_balls_cap.active = True
+        visualizer._ui_dirty = True
         return
     
-    visualizer.max_balls_cap['active'] = False
+    if visualizer.max_balls_cap.active:
+        visualizer.max_balls_cap.active = False
+        visualizer._ui_dirty = True
     
-    mx, my = visualizer.multiplier_button['pos']
-    mw, mh = visualizer.multiplier_button['width'], visualizer.multiplier_button['height']
+    mx, my = visualizer.multiplier_button.pos
+    mw, mh = visualizer.multiplier_button.width, visualizer.multiplier_button.height
     if mx <= pos[0] <= mx + mw and my <= pos[1] <= my + mh:
         _handle_multiplier_cycle(visualizer)
         return
     
-    bx, by = visualizer.split_button['pos']
-    bw, bh = visualizer.split_button['width'], visualizer.split_button['height']
+    bx, by = visualizer.split_button.pos
+    bw, bh = visualizer.split_button.width, visualizer.split_button.height
     if bx <= pos[0] <= bx + bw and by <= pos[1] <= by + bh:
         visualizer.split_enabled = not visualizer.split_enabled
-        visualizer.split_button['label'] = f"Ball Splitting: {'ON' if visualizer.split_enabled else 'OFF'}"
+        visualizer.split_button.label = f"Ball Splitting: {'ON' if visualizer.split_enabled else 'OFF'}"
+        visualizer._ui_dirty = True
         return
     
     for key, slider in visualizer.sliders.items():
-        sx, sy = slider['pos']
-        width = slider['width']
+        sx, sy = slider.pos
+        width = slider.width
         if sx <= pos[0] <= sx + width and sy - 12 <= pos[1] <= sy + 32:
             visualizer._handle_slider_click(pos)
             return
@@ -87,23 +95,22 @@ def _handle_mouse_click(visualizer, pos):
 
 
 def _handle_multiplier_cycle(visualizer):
-    import math
-    
     old_multiplier = visualizer.slider_multiplier
     current_idx = visualizer.multiplier_levels.index(visualizer.slider_multiplier)
     next_idx = (current_idx + 1) % len(visualizer.multiplier_levels)
     visualizer.slider_multiplier = visualizer.multiplier_levels[next_idx]
-    visualizer.multiplier_button['label'] = f'x{visualizer.slider_multiplier}'
+    visualizer.multiplier_button.label = f'x{visualizer.slider_multiplier}'
+    visualizer._ui_dirty = True
     
     if old_multiplier > 0:
         multiplier_ratio = visualizer.slider_multiplier / old_multiplier
         if 'initial_balls' in visualizer.sliders:
             slider = visualizer.sliders['initial_balls']
-            new_value = slider['value'] * multiplier_ratio
-            new_max = slider['base_max'] * visualizer.slider_multiplier
+            new_value = slider.value * multiplier_ratio
+            new_max = slider.base_max * visualizer.slider_multiplier
             if not math.isnan(new_value) and not math.isinf(new_value):
-                slider['value'] = new_value
-                slider['max'] = new_max
+                slider.value = new_value
+                slider.max = new_max
 
 
 def _handle_particle_spawn(visualizer, pos):
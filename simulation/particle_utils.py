@@ -69,6 +69,8 @@ def get_particle_sample(gpu_arrays, method, max_samples=2000):
 
 
 def get_influence_boundaries(gpu_arrays, method, gravity_strength=500.0):
+    """Return a float32 array of shape (K, 3) holding (x, y, radius) per big ball."""
+    empty = np.empty((0, 3), dtype=np.float32)
     try:
         x = gpu_arrays.get('x')
         y = gpu_arrays.get('y')
@@ -76,7 +78,7 @@ def get_influence_boundaries(gpu_arrays, method, gravity_strength=500.0):
         active = gpu_arrays.get('active')
         
         if x is None or y is None or mass is None or active is None:
-            return []
+            return empty
         
         if method == 'cupy':
             x_all = x.get()
@@ -89,20 +91,19 @@ def get_influence_boundaries(gpu_arrays, method, gravity_strength=500.0):
             mass_all = mass.cpu().numpy()
             active_mask = active.cpu().numpy()
         else:
-            return []
+            return empty
         
         large_mask = (mass_all >= 1000.0) & active_mask
         
-        boundaries = []
-        for i in range(len(x_all)):
-            if large_mask[i]:
-                grav_radius = max(50.0, np.sqrt(gravity_strength * mass_all[i] / 1.0) / 5.0)
-                boundaries.append((float(x_all[i]), float(y_all[i]), float(grav_radius)))
+        boundaries = np.empty((int(large_mask.sum()), 3), dtype=np.float32)
+        boundaries[:, 0] = x_all[large_mask]
+        boundaries[:, 1] = y_all[large_mask]
+        boundaries[:, 2] = np.maximum(50.0, np.sqrt(gravity_strength * mass_all[large_mask]) / 5.0)
         
         return boundaries
         
     except Exception:
-        return []
+        return empty
 
 
 def spawn_big_balls(gpu_arrays, method, x, y, count, current_active_count):
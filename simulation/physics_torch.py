@@ -1,5 +1,7 @@
 """PyTorch-based GPU physics engine for particle simulation."""
 
+import math
+
 
 def run_particle_physics_torch(gpu_arrays, params, torch):
     x = gpu_arrays['x']
@@ -42,7 +44,7 @@ def run_particle_physics_torch(gpu_arrays, params, torch):
                 mass[idx] = 1.0
                 radius[idx] = 8.0
                 active[idx] = True
-                ball_color[idx] = torch.tensor([1.0, 1.0, 1.0], dtype=torch.float32, device=x.device)  # White initially
+                ball_color[idx] = 1.0  # White initially
                 active_count += 1
                 small_ball_count += 1
                 drop_timer = 0.3
@@ -128,7 +130,7 @@ def run_particle_physics_torch(gpu_arrays, params, torch):
         
         x_act = x_act + vx_act * dt
         y_act = y_act + vy_act * dt
-        cooldown_act = torch.maximum(torch.tensor(0.0, device=x.device), cooldown_act - dt)
+        cooldown_act = torch.clamp(cooldown_act - dt, min=0.0)
         
         hit_left = x_act - radius_act < 0
         hit_right = x_act + radius_act > 1000
@@ -178,7 +180,7 @@ def run_particle_physics_torch(gpu_arrays, params, torch):
             
             big_i = mass_act[collision_i] >= 100.0
             big_j = mass_act[collision_j] >= 100.0
-            restitution = torch.where(big_i | big_j, torch.tensor(0.95, device=mi.device), torch.tensor(1.0, device=mi.device))
+            restitution = torch.ones_like(mi).masked_fill_(big_i | big_j, 0.95)
             
             impulse_factor_i = 2.0 * mj / (total_mass + 1e-10) * restitution
             impulse_factor_j = 2.0 * mi / (total_mass + 1e-10) * restitution
@@ -267,8 +269,8 @@ def run_particle_physics_torch(gpu_arrays, params, torch):
                                     x[child_global] = x[b_global] + (torch.randn(1, device=x.device) * 8).item()
                                     y[child_global] = y[b_global] + (torch.randn(1, device=x.device) * 8).item()
                                     angle = torch.rand(1, device=x.device).item() * 2 * 3.14159
-                                    vx[child_global] = float(torch.cos(torch.tensor(angle, device=x.device)).item()) * small_ball_speed
-                                    vy[child_global] = float(torch.sin(torch.tensor(angle, device=x.device)).item()) * small_ball_speed
+                                    vx[child_global] = math.cos(angle) * small_ball_speed
+                                    vy[child_global] = math.sin(angle) * small_ball_speed
                                     mass[child_global] = 1.0
                                     radius[child_global] = 8.0
                                     active[child_global] = True
@@ -327,8 +329,8 @@ def run_particle_physics_torch(gpu_arrays, params, torch):
                                     x[child_global] = x[b_global] + (torch.randn(1, device=x.device) * 8).item()
                                     y[child_global] = y[b_global] + (torch.randn(1, device=x.device) * 8).item()
                                     angle = torch.rand(1, device=x.device).item() * 2 * 3.14159
-                                    vx[child_global] = float(torch.cos(torch.tensor(angle, device=x.device)).item()) * small_ball_speed
-                                    vy[child_global] = float(torch.sin(torch.tensor(angle, device=x.device)).item()) * small_ball_speed
+                                    vx[child_global] = math.cos(angle) * small_ball_speed
+                                    vy[child_global] = math.sin(angle) * small_ball_speed
                                     mass[child_global] = 1.0
                                     radius[child_global] = 8.0
                                     active[child_global] = True
@@ -414,13 +416,13 @@ def run_particle_physics_torch(gpu_arrays, params, torch):
         bounce_cooldown[act_indices] = cooldown_act
         
         speed = torch.sqrt(vx_act**2 + vy_act**2)
-        glow_act = torch.minimum(torch.ones_like(speed), speed / 500.0)
+        glow_act = torch.clamp(speed / 500.0, max=1.0)
         glow_intensity[act_indices] = glow_act
 
-        color_state_act = torch.maximum(torch.zeros_like(color_state[act_indices]), color_state[act_indices] - dt * 2.0)
+        color_state_act = torch.clamp(color_state[act_indices] - dt * 2.0, min=0.0)
         color_state[act_indices] = color_state_act
 
-        split_cooldown_act = torch.maximum(torch.zeros_like(split_cooldown[act_indices]), split_cooldown[act_indices] - dt)
+        split_cooldown_act = torch.clamp(split_cooldown[act_indices] - dt, min=0.0)
         split_cooldown[act_indices] = split_cooldown_act
     
     if split_enabled and active_count < 50000:
@@ -7,39 +7,51 @@ It implements `resource_stream(package, resource)` and `resource_exists(package,
 with semantics similar to `pkg_resources`.
 """
 from importlib import resources
+import functools
 import io
 import types
 
 __all__ = ["resource_stream", "resource_exists"]
 
+# Raw bytes of resources already streamed, keyed by (package name, resource).
+# pygame asks for the same small assets (default font, icon) repeatedly.
+_BYTES_CACHE_LIMIT = 2 * 1024 * 1024
+_bytes_cache = {}
+_bytes_cache_size = 0
+
+
+@functools.lru_cache(maxsize=64)
+def _pkg_files(package):
+    """Return the (memoized) `importlib.resources` traversable for `package`."""
+    return resources.files(package)
+
 
 def resource_stream(package, resource):
     """Return a binary file-like object for the resource.
 
     `package` can be a module or a string module name acceptable to importlib.resources.
     """
+    global _bytes_cache_size
+    key = (getattr(package, '__name__', package), resource)
+    data = _bytes_cache.get(key)
+    if data is not None:
+        return io.BytesIO(data)
     try:
-        return resources.open_binary(package, resource)
+        data = _pkg_files(package).joinpath(resource).read_bytes()
+        if _bytes_cache_size + len(data) <= _BYTES_CACHE_LIMIT:
+            _bytes_cache[key] = data
+            _bytes_cache_size += len(data)
+        return io.BytesIO(data)
     except Exception:
-        # If open_binary fails, try to locate the resource via files()
-        try:
-            path = resources.files(package).joinpath(resource)
-            return path.open('rb')
-        except Exception:
-            # Fallback: empty BytesIO to avoid crashes in pygame when resource missing
-            return io.BytesIO(b"")
+        # Fallback: empty BytesIO to avoid crashes in pygame when resource missing
+        return io.BytesIO(b"")
 
 
 def resource_exists(package, resource):
     try:
-        # Use the high-level API when possible
-        return resources.is_resource(package, resource)
+        return _pkg_files(package).joinpath(resource).is_file()
     except Exception:
-        try:
-            path = resources.files(package).joinpath(resource)
-            return path.exists()
-        except Exception:
-            return False
+        return False
 
 # Expose as a module object so we can insert into sys.modules easily
 _module = types.ModuleType('pygame.pkgdata')
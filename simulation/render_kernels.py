@@ -0,0 +1,130 @@
+"""Per-particle draw parameter computation for the visualizer.
+
+Turns sampled particle data into screen coordinates, radii and body/glow
+colors. Uses a numba-compiled kernel when numba is installed and falls back
+to vectorized NumPy otherwise. numba is only imported on the first draw, so
+headless runs never pay for it.
+"""
+
+import numpy as np
+
+# numba-compiled kernel, None until the first draw and False when numba is
+# not installed
+_draw_params_kernel = None
+
+# Glow color multiplier for each of 16 glow-intensity bins. The glow color is
+# quantized further when sprites are cached, so finer steps are never visible.
+_GLOW_BINS = 16
+_GLOW_MULT_LUT = (0.8 + 0.4 * np.arange(_GLOW_BINS) / (_GLOW_BINS - 1)).astype(np.float32)
+
+
+def compute_draw_params(positions, masses, colors, glows, scale_x, scale_y):
+    """Return int32 arrays `(sx, sy, radii, glow_radii, base_rgb, glow_rgb)`.
+
+    `colors` is either (n, 3) rgb in [0, 1] or (n,) color_state; the color
+    outputs have shape (n, 3). `colors`/`glows` may be None or shorter than
+    `positions`, in which case the remaining particles use default values.
+    """
+    if _get_kernel():
+        return _compute_draw_params_numba(positions, masses, colors, glows, scale_x, scale_y)
+    return _compute_draw_params_numpy(positions, masses, colors, glows, scale_x, scale_y)
+
+
+def _compute_draw_params_numpy(positions, masses, colors, glows, scale_x, scale_y):
+    num_particles = len(positions)
+    sx = (positions[:, 0] * scale_x).astype(np.int32)
+    sy = (positions[:, 1] * scale_y).astype(np.int32)
+    radii = np.where(masses >= 1000, 36, 8).astype(np.int32)
+
+    base = np.empty((num_particles, 3), dtype=np.float32)
+    base[:] = (180, 180, 200)
+    if colors is not None:
+        n = min(len(colors), num_particles)
+        if colors.ndim == 2 and colors.shape[1] == 3:
+            base[:n] = colors[:n] * 255
+        else:
+            color_state = colors[:n]
+            base[:n, 0] = 180 + 75 * color_state
+            base[:n, 1] = 180 - 180 * color_state
+            base[:n, 2] = 200 - 200 * color_state
+    base_rgb = np.clip(base, 0, 255).astype(np.int32)
+
+    glow = np.zeros(num_particles, dtype=np.float32)
+    if glows is not None:
+        n = min(len(glows), num_particles)
+        glow[:n] = glows[:n]
+    glow_radii = radii + (3 + 5 * glow).astype(np.int32)
+    base_glow = np.minimum(255, (base_rgb * 1.3).astype(np.int32))
+    bins = np.clip((glow * (_GLOW_BINS - 1)).astype(np.int32), 0, _GLOW_BINS - 1)
+    glow_rgb = np.minimum(255, (base_glow * _GLOW_MULT_LUT[bins][:, None]).astype(np.int32))
+    return sx, sy, radii, glow_radii, base_rgb, glow_rgb
+
+
+def _compute_draw_params_numba(positions, masses, colors, glows, scale_x, scale_y):
+    # The kernel is typed per array shape, so give `colors` one fixed 2-D
+    # layout and select the interpretation with `color_mode`
+    if colors is None:
+        color_mode, colors_2d = 0, np.zeros((0, 3), dtype=np.float32)
+    elif colors.ndim == 2 and colors.shape[1] == 3:
+        color_mode, colors_2d = 1, colors
+    else:
+        color_mode, colors_2d = 2, colors.reshape(-1, 1)
+    if glows is None:
+        glows = np.zeros(0, dtype=np.float32)
+
+    num_particles = len(positions)
+    sx = np.empty(num_particles, dtype=np.int32)
+    sy = np.empty(num_particles, dtype=np.int32)
+    radii = np.empty(num_particles, dtype=np.int32)
+    glow_radii = np.empty(num_particles, dtype=np.int32)
+    base_rgb = np.empty((num_particles, 3), dtype=np.int32)
+    glow_rgb = np.empty((num_particles, 3), dtype=np.int32)
+    _draw_params_kernel(positions, masses, colors_2d, glows, color_mode, scale_x, scale_y,
+                        sx, sy, radii, glow_radii, base_rgb, glow_rgb)
+    return sx, sy, radii, glow_radii, base_rgb, glow_rgb
+
+
+def _get_kernel():
+    global _draw_params_kernel
+    if _draw_params_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _draw_params_kernel = False
+        else:
+            _draw_params_kernel = _build_kernel(numba)
+    return _draw_params_kernel
+
+
+def _build_kernel(numba):
+    @numba.njit(parallel=True, cache=True)
+    def _draw_params_kernel(positions, masses, colors, glows, color_mode, scale_x, scale_y,
+                            sx, sy, radii, glow_radii, base_rgb, glow_rgb):
+        for i in numba.prange(positions.shape[0]):
+            sx[i] = int(positions[i, 0] * scale_x)
+            sy[i] = int(positions[i, 1] * scale_y)
+            radius = 36 if masses[i] >= 1000 else 8
+            glow = glows[i] if i < glows.shape[0] else 0.0
+            radii[i] = radius
+            glow_radii[i] = radius + int(3 + 5 * glow)
+
+            if color_mode == 1 and i < colors.shape[0]:
+                r = colors[i, 0] * 255
+                g = colors[i, 1] * 255
+                b = colors[i, 2] * 255
+            elif color_mode == 2 and i < colors.shape[0]:
+                r = 180 + 75 * colors[i, 0]
+                g = 180 - 180 * colors[i, 0]
+                b = 200 - 200 * colors[i, 0]
+            else:
+                r, g, b = 180.0, 180.0, 200.0
+            base_rgb[i, 0] = int(min(255.0, max(0.0, r)))
+            base_rgb[i, 1] = int(min(255.0, max(0.0, g)))
+            base_rgb[i, 2] = int(min(255.0, max(0.0, b)))
+
+            mult = _GLOW_MULT_LUT[min(_GLOW_BINS - 1, max(0, int(glow * (_GLOW_BINS - 1))))]
+            for c in range(3):
+                base_glow = min(255, int(base_rgb[i, c] * 1.3))
+                glow_rgb[i, c] = min(255, int(base_glow * mult))
+
+    return _draw_params_kernel
@@ -5,8 +5,36 @@ and updated buttons while keeping the same function signatures used by
 `visualizer.py` so integration is minimal.
 """
 
+import functools
 import math
 
+# Rendered text surfaces reused across frames. Font rasterization is the most
+# expensive part of drawing the UI and most strings rarely change.
+_TEXT_CACHE_LIMIT = 512
+_text_cache = {}
+# Per-line slots for the stats panel:
+# index -> (font, color, values, text, surface)
+_stats_line_cache = {}
+# Pre-drawn slider tick strips keyed by (width, ticks, color)
+_tick_cache = {}
+
+# Colors for the stats panel and sliders. Pass a dict with the same keys as
+# `theme=` to restyle them without touching the drawing code.
+DARK_THEME = {
+    'panel_bg': (22, 24, 28),
+    'title': (245, 245, 245),
+    'text': (200, 200, 200),
+    'label': (230, 230, 230),
+    'track_bg': (36, 38, 44),
+    'tick': (70, 75, 80),
+    'tick_label': (150, 150, 150),
+    'fill': (60, 140, 220),
+    'handle': (245, 245, 245),
+    'handle_shadow': (16, 18, 20),
+    'value_bg': (28, 32, 36),
+    'value_text': (220, 220, 220),
+}
+
 
 def _hsv_to_rgb(h, s, v):
     # h in [0,1], s in [0,1], v in [0,1]
@@ -31,15 +59,63 @@ def _hsv_to_rgb(h, s, v):
     return int(r * 255), int(g * 255), int(b * 255)
 
 
-def _rounded_rect(surface, rect, color, radius=8):
-    try:
-        import pygame
-        pygame.draw.rect(surface, color, rect, border_radius=radius)
-    except Exception:
-        surface.fill(color, rect)
+# Hue lookup tables for hsv_to_rgb, one per (s, v) pair in use
+_HSV_LUT_SIZE = 256
+_hsv_luts = {}
+
+
+def hsv_to_rgb(h, s=1.0, v=1.0):
+    """Convert HSV in [0, 1] to an (r, g, b) tuple of 0-255 ints.
+
+    Hue is quantized to 1/256 steps and looked up from a per-(s, v) table.
+    """
+    lut = _hsv_luts.get((s, v))
+    if lut is None:
+        lut = [_hsv_to_rgb(i / _HSV_LUT_SIZE, s, v) for i in range(_HSV_LUT_SIZE)]
+        _hsv_luts[(s, v)] = lut
+    return lut[int(h * _HSV_LUT_SIZE) % _HSV_LUT_SIZE]
+
+
+@functools.lru_cache(maxsize=256)
+def _rounded_sprite(pygame, width, height, color, radius, border_color=None, border_width=0):
+    # Rasterize the rounded corners (and optional outline) once per widget look
+    sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(sprite, color, (0, 0, width, height), border_radius=radius)
+    if border_color is not None:
+        pygame.draw.rect(sprite, border_color, (0, 0, width, height), border_width, border_radius=radius)
+    return sprite
+
+
+def _rounded_rect(pygame, surface, rect, color, radius=8, border_color=None, border_width=0):
+    x, y, width, height = rect
+    sprite = _rounded_sprite(pygame, width, height, color, radius, border_color, border_width)
+    surface.blit(sprite, (x, y))
+
 
+def _render_text(font, text, color):
+    key = (font, text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        if len(_text_cache) >= _TEXT_CACHE_LIMIT:
+            _text_cache.clear()
+        surface = font.render(text, True, color)
+        _text_cache[key] = surface
+    return surface
 
-def draw_stats(screen, font, window_size, stats_data):
+
+def _tick_surface(pygame, width, ticks, color):
+    key = (width, ticks, color)
+    surface = _tick_cache.get(key)
+    if surface is None:
+        surface = pygame.Surface((width + 1, 7), pygame.SRCALPHA)
+        for i in range(ticks + 1):
+            tx = int(i * (width / ticks))
+            pygame.draw.line(surface, color, (tx, 0), (tx, 6), 1)
+        _tick_cache[key] = surface
+    return surface
+
+
+def draw_stats(screen, font, window_size, stats_data, theme=DARK_THEME):
     # Static, high-contrast stats panel for clarity (no animation)
     padding = 12
     w = 300
@@ -47,66 +123,65 @@ def draw_stats(screen, font, window_size, stats_data):
     x = window_size[0] - w - padding
     y = padding
 
-    panel = screen.subsurface((x, y, w, h)).copy()
-    panel.fill((22, 24, 28, 220))
-    screen.blit(panel, (x, y))
+    screen.fill(theme['panel_bg'], (x, y, w, h))
 
-    title = font.render("Simulation Stats", True, (245, 245, 245))
+    title = _render_text(font, "Simulation Stats", theme['title'])
     screen.blit(title, (x + 14, y + 10))
 
     backend_mult = stats_data.get('backend_multiplier', 1)
-    total_computed = stats_data['total_particles'] * backend_mult
-
-    lines = [
-        f"Active: {stats_data['active_particles']:,} / {stats_data['total_particles']:,}",
-        f"Rendered: {stats_data['rendered_particles']:,}",
-        f"Backend: {backend_mult}x  Total: {total_computed:,}",
-        f"FPS: {stats_data['fps']:.1f}",
-        f"GPU: {stats_data['gpu_util']:.0f}%",
-        f"Time: {stats_data['elapsed_time']:.1f}s",
-    ]
-
+    total = stats_data['total_particles']
+
+    lines = (
+        ("Active: {:,} / {:,}", (stats_data['active_particles'], total)),
+        ("Rendered: {:,}", (stats_data['rendered_particles'],)),
+        ("Backend: {}x  Total: {:,}", (backend_mult, total * backend_mult)),
+        ("FPS: {:.1f}", (stats_data['fps'],)),
+        ("GPU: {:.0f}%", (stats_data['gpu_util'],)),
+        ("Time: {:.1f}s", (stats_data['elapsed_time'],)),
+    )
+
+    color = theme['text']
     oy = y + 40
-    for line in lines:
-        text = font.render(line, True, (200, 200, 200))
-        screen.blit(text, (x + 14, oy))
+    for i, (fmt, values) in enumerate(lines):
+        # Format only when the raw values moved, re-render only when the text did
+        cached = _stats_line_cache.get(i)
+        same_style = cached is not None and cached[0] is font and cached[1] == color
+        if not same_style or cached[2] != values:
+            text = fmt.format(*values)
+            if not same_style or cached[3] != text:
+                cached = (font, color, values, text, font.render(text, True, color))
+            else:
+                cached = (font, color, values, text, cached[4])
+            _stats_line_cache[i] = cached
+        screen.blit(cached[4], (x + 14, oy))
         oy += 22
 
 
-
-def draw_sliders(pygame, screen, small_font, sliders, dragging_slider):
+def draw_sliders(pygame, screen, small_font, sliders, dragging_slider, theme=DARK_THEME):
     for key, slider in sliders.items():
-        x, y = slider['pos']
-        width = slider['width']
+        x, y = slider.pos
+        width = slider.width
         height = 18
 
         # Panel label
-        label_text = slider.get('label', key)
-        label = small_font.render(label_text, True, (230, 230, 230))
+        label = _render_text(small_font, slider.label, theme['label'])
         screen.blit(label, (x, y - 28))
 
         # Track
         track_rect = (x, y, width, height)
-        _rounded_rect(screen, track_rect, (36, 38, 44), radius=10)
+        _rounded_rect(pygame, screen, track_rect, theme['track_bg'], radius=10)
 
-        # Draw tick marks (5 divisions)
-        ticks = 5
-        for i in range(ticks + 1):
-            tx = x + int(i * (width / ticks))
-            pygame.draw.line(screen, (70, 75, 80), (tx, y + height + 4), (tx, y + height + 10), 1)
-            # label min/max only
-            if i == 0:
-                min_label = small_font.render(str(slider.get('min', '')), True, (150, 150, 150))
-                screen.blit(min_label, (tx - 2, y + height + 12))
-            elif i == ticks:
-                max_label = small_font.render(str(slider.get('max', '')), True, (150, 150, 150))
-                w_lab = max_label.get_width()
-                screen.blit(max_label, (tx - w_lab + 2, y + height + 12))
+        # Tick marks (5 divisions), label min/max only
+        screen.blit(_tick_surface(pygame, width, 5, theme['tick']), (x, y + height + 4))
+        min_label = _render_text(small_font, str(slider.min), theme['tick_label'])
+        screen.blit(min_label, (x - 2, y + height + 12))
+        max_label = _render_text(small_font, str(slider.max), theme['tick_label'])
+        screen.blit(max_label, (x + width - max_label.get_width() + 2, y + height + 12))
 
         # Filled portion
         normalized = 0.0
         try:
-            normalized = (slider['value'] - slider['min']) / max(1e-9, (slider['max'] - slider['min']))
+            normalized = (slider.value - slider.min) / max(1e-9, (slider.max - slider.min))
             normalized = max(0.0, min(1.0, normalized))
         except Exception:
             normalized = 0.0
@@ -114,17 +189,17 @@ def draw_sliders(pygame, screen, small_font, sliders, dragging_slider):
         filled_w = int(width * normalized)
         if filled_w > 0:
             # Static fill color for clarity
-            _rounded_rect(screen, (x, y, filled_w, height), (60, 140, 220), radius=10)
+            _rounded_rect(pygame, screen, (x, y, filled_w, height), theme['fill'], radius=10)
 
         # Handle with subtle shadow and static rim
         handle_x = x + filled_w
         handle_radius = 11
-        pygame.draw.circle(screen, (16, 18, 20), (handle_x, y + height // 2), handle_radius + 4)
-        pygame.draw.circle(screen, (245, 245, 245), (handle_x, y + height // 2), handle_radius)
+        pygame.draw.circle(screen, theme['handle_shadow'], (handle_x, y + height // 2), handle_radius + 4)
+        pygame.draw.circle(screen, theme['handle'], (handle_x, y + height // 2), handle_radius)
 
         # Value box
-        val = slider['value']
-        if slider.get('is_int', False):
+        val = slider.value
+        if slider.is_int:
             val_str = f"{int(val)}"
         else:
             val_str = f"{val:.1f}"
@@ -133,50 +208,49 @@ def draw_sliders(pygame, screen, small_font, sliders, dragging_slider):
         vb_x = x + width + 12
         vb_y = y - 1
         # Static value box
-        _rounded_rect(screen, (vb_x, vb_y, vb_w, vb_h), (28, 32, 36), radius=6)
-        vb_text = small_font.render(val_str, True, (220, 220, 220))
+        _rounded_rect(pygame, screen, (vb_x, vb_y, vb_w, vb_h), theme['value_bg'], radius=6)
+        vb_text = small_font.render(val_str, True, theme['value_text'])
         screen.blit(vb_text, (vb_x + 8, vb_y + 2))
 
 
 def draw_text_input(pygame, screen, font, small_font, text_input_data):
-    x, y = text_input_data['pos']
-    width, height = text_input_data['width'], text_input_data['height']
+    x, y = text_input_data.pos
+    width, height = text_input_data.width, text_input_data.height
 
-    bg_color = (36, 40, 46) if text_input_data['active'] else (28, 32, 36)
-    _rounded_rect(screen, (x, y, width, height), bg_color, radius=6)
-    pygame.draw.rect(screen, (60, 70, 80), (x, y, width, height), 1, border_radius=6)
+    bg_color = (36, 40, 46) if text_input_data.active else (28, 32, 36)
+    _rounded_rect(pygame, screen, (x, y, width, height), bg_color, radius=6,
+                  border_color=(60, 70, 80), border_width=1)
 
-    label = small_font.render(text_input_data['label'], True, (180, 180, 180))
+    label = _render_text(small_font, text_input_data.label, (180, 180, 180))
     screen.blit(label, (x, y - 20))
 
-    value = text_input_data['value'] or ''
+    value = text_input_data.value or ''
     value_text = font.render(value, True, (230, 230, 230))
     screen.blit(value_text, (x + 8, y + (height - value_text.get_height()) // 2))
 
 
 def draw_multiplier_button(pygame, screen, font, button_data):
-    x, y = button_data['pos']
-    width, height = button_data['width'], button_data['height']
-    label = button_data.get('label', '')
+    x, y = button_data.pos
+    width, height = button_data.width, button_data.height
+    label = button_data.label
 
-    _rounded_rect(screen, (x, y, width, height), (30, 36, 44), radius=8)
-    pygame.draw.rect(screen, (70, 100, 160), (x, y, width, height), 2, border_radius=8)
+    _rounded_rect(pygame, screen, (x, y, width, height), (30, 36, 44), radius=8,
+                  border_color=(70, 100, 160), border_width=2)
 
-    txt = font.render(label, True, (220, 220, 220))
+    txt = _render_text(font, label, (220, 220, 220))
     rect = txt.get_rect(center=(x + width // 2, y + height // 2))
     screen.blit(txt, rect)
 
 
 def draw_toggle_button(pygame, screen, font, button_data, enabled):
-    x, y = button_data['pos']
-    width, height = button_data['width'], button_data['height']
-    label_on = button_data.get('label', 'Toggle')
+    x, y = button_data.pos
+    width, height = button_data.width, button_data.height
 
     base = (90, 180, 120) if enabled else (100, 110, 140)
-    _rounded_rect(screen, (x, y, width, height), base, radius=8)
-    pygame.draw.rect(screen, (30, 30, 30), (x, y, width, height), 2, border_radius=8)
+    _rounded_rect(pygame, screen, (x, y, width, height), base, radius=8,
+                  border_color=(30, 30, 30), border_width=2)
 
     label_text = "Ball Splitting: ON" if enabled else "Ball Splitting: OFF"
-    txt = font.render(label_text, True, (18, 18, 18) if enabled else (230, 230, 230))
+    txt = _render_text(font, label_text, (18, 18, 18) if enabled else (230, 230, 230))
     rect = txt.get_rect(center=(x + width // 2, y + height // 2))
     screen.blit(txt, rect)
@@ -1,11 +1,13 @@
 """GPU Particle Simulation Visualizer."""
 
+import math
 import time
-import random
 from typing import Optional, Tuple, List
 import numpy as np
 from . import ui_components  # Import UI rendering functions
 from . import event_handler  # Import event handling
+from . import render_kernels  # Per-particle draw parameter math
+from .controls import Button, Slider, TextInput
 
 
 class ParticleVisualizer:
@@ -31,41 +33,44 @@ class ParticleVisualizer:
         self.running = False
         self.pygame = None
         self.screen = None
-        self.clock = None
         self.font = None
         self.small_font = None
-        self.colors = []
-        self.particle_sizes = []
+        self.colors = np.empty((0, 3), dtype=np.uint8)
+        self.particle_sizes = np.empty(0, dtype=np.uint8)
         self.slider_multiplier = 1
         self.multiplier_levels = [1, 10, 100, 1000]
-        self.multiplier_button = {
-            'pos': (0, 0),
-            'width': 80,
-            'height': 30,
-            'label': 'x1'
-        }
+        self.multiplier_button = Button(label='x1', width=80, height=30)
         self.sliders = {
-            'gravity': {'value': 500.0, 'min': 0.0, 'max': 10000.0, 'pos': (0, 0), 'width': 220, 'label': 'Big Ball Gravity'},
-            'small_ball_speed': {'value': 300.0, 'min': 50.0, 'max': 600.0, 'pos': (0, 0), 'width': 220, 'label': 'Small Ball Speed'},
-            'initial_balls': {'value': 1.0, 'min': 1.0, 'max': 10.0, 'pos': (0, 0), 'width': 220, 'label': 'Initial Balls', 'is_int': True, 'base_max': 10.0}
+            'gravity': Slider(value=500.0, min=0.0, max=10000.0, label='Big Ball Gravity'),
+            'small_ball_speed': Slider(value=300.0, min=50.0, max=600.0, label='Small Ball Speed'),
+            'initial_balls': Slider(value=1.0, min=1.0, max=10.0, label='Initial Balls', is_int=True, base_max=10.0)
         }
         self.dragging_slider = None
         
-        self.max_balls_cap = {
-            'pos': (0, 0),
-            'width': 100,
-            'height': 30,
-            'value': '100000',
-            'active': False,
-            'label': 'Max Cap'
-        }
+        self.max_balls_cap = TextInput(label='Max Cap', value='100000', width=100, height=30)
         
         self.split_enabled = False
-        self.split_button = {
-            'pos': (0, 0),
-            'width': 160,
-            'height': 30,
-            'label': 'Ball Splitting: OFF'
+        self.split_button = Button(label='Ball Splitting: OFF', width=160, height=30)
+
+        # Pre-rendered particle sprites (glow + body), keyed by packed
+        # radius/glow-radius/quantized-color codes; filled lazily
+        self._sprite_cache = {}
+
+        # Offscreen layer holding the rendered control strip; it is redrawn
+        # only when a handler that changes a control sets `_ui_dirty`.
+        self._controls_layer = None
+        self._controls_rect = None
+        self._ui_dirty = True
+
+        # Stats passed to draw_stats; updated in place every frame
+        self._stats_data = {
+            'total_particles': 0,
+            'active_particles': 0,
+            'rendered_particles': 0,
+            'fps': 0.0,
+            'gpu_util': 0.0,
+            'elapsed_time': 0.0,
+            'backend_multiplier': 1
         }
         
         self._init_pygame()
@@ -89,19 +94,14 @@ class ParticleVisualizer:
             pygame.init()
             self.screen = pygame.display.set_mode(self.window_size)
             pygame.display.set_caption("GPU Particle Simulation - Benchmark Visualization")
-            self.clock = pygame.time.Clock()
             self.font = pygame.font.Font(None, 28)
             self.small_font = pygame.font.Font(None, 20)
+            self._controls_layer = pygame.Surface(self.window_size, pygame.SRCALPHA)
             self.running = True
             
-            for _ in range(self.max_render_particles):
-                color = (
-                    random.randint(100, 255),
-                    random.randint(100, 255),
-                    random.randint(100, 255)
-                )
-                self.colors.append(color)
-                self.particle_sizes.append(random.randint(3, 8))
+            rng = np.random.default_rng()
+            self.colors = rng.integers(100, 256, size=(self.max_render_particles, 3), dtype=np.uint8)
+            self.particle_sizes = rng.integers(3, 9, size=self.max_render_particles, dtype=np.uint8)
                 
         except ImportError:
             self.running = False
@@ -126,25 +126,31 @@ class ParticleVisualizer:
             s = self.sliders.get(key)
             if s is None:
                 continue
-            s['pos'] = (x, control_y)
-            s['width'] = slider_width
+            s.pos = (x, control_y)
+            s.width = slider_width
             x += slider_width + spacing
 
         # Max cap input
-        self.max_balls_cap['pos'] = (x, control_y)
-        self.max_balls_cap['width'] = 120
-        x += self.max_balls_cap['width'] + spacing
+        self.max_balls_cap.pos = (x, control_y)
+        self.max_balls_cap.width = 120
+        x += self.max_balls_cap.width + spacing
 
         # Multiplier
-        self.multiplier_button['pos'] = (x, control_y)
-        self.multiplier_button['width'] = 60
-        self.multiplier_button['height'] = 30
-        x += self.multiplier_button['width'] + spacing
+        self.multiplier_button.pos = (x, control_y)
+        self.multiplier_button.width = 60
+        self.multiplier_button.height = 30
+        x += self.multiplier_button.width + spacing
 
         # Split button
-        self.split_button['pos'] = (x, control_y)
-        self.split_button['width'] = 140
-        self.split_button['height'] = 30
+        self.split_button.pos = (x, control_y)
+        self.split_button.width = 140
+        self.split_button.height = 30
+
+        # Area covered by the controls, from slider labels down to tick labels
+        top = max(0, control_y - 36)
+        bottom = min(self.window_size[1], control_y + 60)
+        self._controls_rect = (0, top, self.window_size[0], bottom - top)
+        self._ui_dirty = True
     
     def is_available(self) -> bool:
         return self.running and self.pygame is not None
@@ -155,7 +161,7 @@ class ParticleVisualizer:
         masses: np.ndarray,
         colors: np.ndarray,
         glows: np.ndarray,
-        influence_boundaries: list,
+        influence_boundaries: np.ndarray,
         total_particles: int,
         active_particles: int,
         fps: float = 0,
@@ -165,133 +171,125 @@ class ParticleVisualizer:
         if not self.is_available():
             return
         
-        self.screen.fill((5, 5, 15))
+        # The screen is cleared every frame, so the (5, 5, 15) fade is
+        # pre-subtracted from the background and ring colors instead of being
+        # applied as a full-screen BLEND_RGBA_SUB pass
+        self.screen.fill((0, 0, 0))
         
         scale_x = self.window_size[0] / 1000.0
         scale_y = self.window_size[1] / 800.0
         
-        for bx, by, bradius in influence_boundaries:
-            screen_x = int(bx * scale_x)
-            screen_y = int(by * scale_y)
-            screen_radius = max(10, int(bradius * min(scale_x, scale_y)))
-            
-            if screen_radius > 5:
-                self.pygame.draw.circle(
-                    self.screen,
-                    (255, 255, 255),
-                    (screen_x, screen_y),
-                    screen_radius,
-                    3
-                )
-            
-            ball_radius = int(36 * min(scale_x, scale_y))
-            self.pygame.draw.circle(
-                self.screen,
-                (200, 200, 200),
-                (screen_x, screen_y),
-                ball_radius,
-                1
-            )
-        
-        blur_surface = self.pygame.Surface(self.window_size, self.pygame.SRCALPHA)
-        blur_surface.fill((5, 5, 15, 8))
-        self.screen.blit(blur_surface, (0, 0), special_flags=self.pygame.BLEND_RGBA_SUB)
+        if len(influence_boundaries) > 0:
+            s_min = min(scale_x, scale_y)
+            ball_radius = int(36 * s_min)
+            # (K, 3) array of (x, y, radius); sequences of tuples also work
+            bounds = np.asarray(influence_boundaries, dtype=np.float32).reshape(-1, 3)
+            bxs = (bounds[:, 0] * scale_x).astype(np.int32).tolist()
+            bys = (bounds[:, 1] * scale_y).astype(np.int32).tolist()
+            brs = np.maximum(10, (bounds[:, 2] * s_min).astype(np.int32)).tolist()
+            draw_circle = self.pygame.draw.circle
+            screen = self.screen
+            for screen_x, screen_y, screen_radius in zip(bxs, bys, brs):
+                draw_circle(screen, (250, 250, 240), (screen_x, screen_y), screen_radius, 3)
+                draw_circle(screen, (195, 195, 185), (screen_x, screen_y), ball_radius, 1)
         
         num_particles = len(positions)
-        for i in range(num_particles):
-            x = int(positions[i, 0] * scale_x)
-            y = int(positions[i, 1] * scale_y)
-            
-            mass = masses[i]
-            if colors is not None and i < len(colors):
-                if len(colors.shape) == 2 and colors.shape[1] == 3:
-                    rgb = colors[i]
-                    base_color = (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
-                else:
-                    color_state = colors[i]
-                    base_color = (int(180 + 75 * color_state), int(180 - 180 * color_state), int(200 - 200 * color_state))
-            else:
-                base_color = (180, 180, 200)
-            
-            glow_intensity = glows[i] if glows is not None and i < len(glows) else 0.0
-            
-            if mass >= 1000:
-                radius = 36
-            else:
-                radius = 8
-            
-            base_glow = (
-                min(255, int(base_color[0] * 1.3)),
-                min(255, int(base_color[1] * 1.3)),
-                min(255, int(base_color[2] * 1.3))
+        if num_particles > self.max_render_particles:
+            # Deterministic even subsample so draw cost stays bounded
+            idx = np.linspace(0, num_particles - 1, self.max_render_particles).astype(np.intp)
+            positions = positions[idx]
+            masses = masses[idx]
+            if colors is not None:
+                colors = colors[idx[idx < len(colors)]]
+            if glows is not None:
+                glows = glows[idx[idx < len(glows)]]
+            num_particles = self.max_render_particles
+        if num_particles > 0:
+            sx, sy, radii, glow_radii, base_rgb, glow_rgb = render_kernels.compute_draw_params(
+                positions, masses, colors, glows, scale_x, scale_y
+            )
+
+            # Quantize colors to 5 bits per channel and pack everything that
+            # determines a sprite's pixels into one integer key
+            base_q = base_rgb >> 3
+            glow_q = glow_rgb >> 3
+            keys = (
+                ((glow_radii.astype(np.int64) << 6) | radii) << 30
+                | ((base_q[:, 0] << 10) | (base_q[:, 1] << 5) | base_q[:, 2]) << 15
+                | ((glow_q[:, 0] << 10) | (glow_q[:, 1] << 5) | glow_q[:, 2])
+            )
+            unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+
+            sprites = []
+            for key, i in zip(unique_keys.tolist(), first.tolist()):
+                sprite = self._sprite_cache.get(key)
+                if sprite is None:
+                    sprite = self._make_particle_sprite(
+                        int(radii[i]), int(glow_radii[i]),
+                        (base_q[i] << 3).tolist(), (glow_q[i] << 3).tolist()
+                    )
+                    if len(self._sprite_cache) >= 4096:
+                        self._sprite_cache.clear()
+                    self._sprite_cache[key] = sprite
+                sprites.append(sprite)
+
+            self.screen.blits(
+                [
+                    (sprites[j], (x, y))
+                    for j, x, y in zip(inverse.tolist(), (sx - glow_radii).tolist(), (sy - glow_radii).tolist())
+                ],
+                doreturn=False
             )
-            
-            glow_radius = radius + int(3 + 5 * glow_intensity)
-            glow_r = min(255, int(base_glow[0] * (0.8 + 0.4 * glow_intensity)))
-            glow_g = min(255, int(base_glow[1] * (0.8 + 0.4 * glow_intensity)))
-            glow_b = min(255, int(base_glow[2] * (0.8 + 0.4 * glow_intensity)))
-            
-            self.pygame.draw.circle(self.screen, (glow_r, glow_g, glow_b), (x, y), glow_radius)
-            self.pygame.draw.circle(self.screen, base_color, (x, y), radius)
         
         # Draw modern UI panels and controls
-        stats_data = {
-            'total_particles': total_particles,
-            'active_particles': active_particles,
-            'rendered_particles': num_particles,
-            'fps': fps,
-            'gpu_util': gpu_util,
-            'elapsed_time': elapsed_time,
-            'backend_multiplier': 1
-        }
+        stats_data = self._stats_data
+        stats_data['total_particles'] = total_particles
+        stats_data['active_particles'] = active_particles
+        stats_data['rendered_particles'] = num_particles
+        stats_data['fps'] = fps
+        stats_data['gpu_util'] = gpu_util
+        stats_data['elapsed_time'] = elapsed_time
         ui_components.draw_stats(self.screen, self.font, self.window_size, stats_data)
 
-        self._draw_sliders()
-        self._draw_text_input()
-        self._draw_multiplier_button()
-        self._draw_toggle_button()
+        self._draw_controls()
         
         self.pygame.display.flip()
-        self.clock.tick()  # Unlimited FPS - no artificial cap
-    
-    def _draw_stats(
-        self,
-        total_particles: int,
-        active_particles: int,
-        rendered_particles: int,
-        fps: float,
-        gpu_util: float,
-        elapsed_time: float
-    ):
-        backend_mult = int(self.sliders.get('backend_multiplier', {}).get('value', 1))
-        stats_data = {
-            'total_particles': total_particles,
-            'active_particles': active_particles,
-            'rendered_particles': rendered_particles,
-            'fps': fps,
-            'gpu_util': gpu_util,
-            'elapsed_time': elapsed_time,
-            'backend_multiplier': backend_mult
-        }
-        ui_components.draw_stats(self.screen, self.font, self.window_size, stats_data)
     
-    def _draw_sliders(self):
-        ui_components.draw_sliders(self.pygame, self.screen, self.small_font, self.sliders, self.dragging_slider)
+    def _make_particle_sprite(self, radius, glow_radius, base_color, glow_color):
+        size = 2 * glow_radius + 2
+        sprite = self.pygame.Surface((size, size), self.pygame.SRCALPHA)
+        self.pygame.draw.circle(sprite, glow_color, (glow_radius, glow_radius), glow_radius)
+        self.pygame.draw.circle(sprite, base_color, (glow_radius, glow_radius), radius)
+        return sprite.convert_alpha()
+
+    def _draw_controls(self):
+        layer = self._controls_layer
+        if self._ui_dirty:
+            layer.fill((0, 0, 0, 0), self._controls_rect)
+            self._draw_sliders(layer)
+            self._draw_text_input(layer)
+            self._draw_multiplier_button(layer)
+            self._draw_toggle_button(layer)
+            self._ui_dirty = False
+        self.screen.blit(layer, self._controls_rect[:2], area=self._controls_rect)
+
+    def _draw_sliders(self, surface):
+        ui_components.draw_sliders(self.pygame, surface, self.small_font, self.sliders, self.dragging_slider)
     
-    def _draw_toggle_button(self):
-        ui_components.draw_toggle_button(self.pygame, self.screen, self.small_font, self.split_button, self.split_enabled)
+    def _draw_toggle_button(self, surface):
+        ui_components.draw_toggle_button(self.pygame, surface, self.small_font, self.split_button, self.split_enabled)
     
-    def _draw_text_input(self):
-        ui_components.draw_text_input(self.pygame, self.screen, self.font, self.small_font, self.max_balls_cap)
+    def _draw_text_input(self, surface):
+        ui_components.draw_text_input(self.pygame, surface, self.font, self.small_font, self.max_balls_cap)
     
-    def _draw_multiplier_button(self):
-        ui_components.draw_multiplier_button(self.pygame, self.screen, self.small_font, self.multiplier_button)
+    def _draw_multiplier_button(self, surface):
+        ui_components.draw_multiplier_button(self.pygame, surface, self.small_font, self.multiplier_button)
     
     def _handle_slider_click(self, pos):
         mx, my = pos
         for key, slider in self.sliders.items():
-            x, y = slider['pos']
-            width = slider['width']
+            x, y = slider.pos
+            width = slider.width
             if x <= mx <= x + width and y - 12 <= my <= y + 32:
                 self.dragging_slider = key
                 self._update_slider_value(key, mx)
@@ -303,34 +301,34 @@ class ParticleVisualizer:
     
     def _update_slider_value(self, key, mouse_x):
         slider = self.sliders[key]
-        x = slider['pos'][0]
-        width = slider['width']
+        x = slider.pos[0]
+        width = slider.width
         
         mouse_x = max(x, min(mouse_x, x + width))
         normalized = (mouse_x - x) / width
-        value = slider['min'] + normalized * (slider['max'] - slider['min'])
+        value = slider.min + normalized * (slider.max - slider.min)
         
-        import math
         if math.isnan(value) or math.isinf(value):
-            value = slider['min']
+            value = slider.min
         
-        if slider.get('is_int', False):
+        if slider.is_int:
             value = round(value)
         
-        slider['value'] = value
+        slider.value = value
+        self._ui_dirty = True
     
     def get_slider_values(self):
-        import math
+        # A plain loop beats a NumPy round-trip for a handful of scalars
         values = {}
         for key, slider in self.sliders.items():
-            val = slider['value']
-            if math.isnan(val) or math.isinf(val):
-                val = slider['min']
-                slider['value'] = val
+            val = slider.value
+            if not math.isfinite(val):
+                val = slider.min
+                slider.value = val
+                self._ui_dirty = True
             values[key] = val
         
-        max_cap = int(self.max_balls_cap['value']) if self.max_balls_cap['value'] else 100000
-        values['max_balls_cap'] = max_cap
+        values['max_balls_cap'] = self.max_balls_cap.int_value
         
         values['backend_multiplier'] = 1
         values['big_ball_count'] = 3
@@ -341,7 +339,7 @@ class ParticleVisualizer:
         return self.split_enabled
     
     def get_max_balls_cap(self):
-        return self.max_balls_cap['value']
+        return self.max_balls_cap.int_value
     
     def get_spawn_requests(self):
         if not hasattr(self, 'spawn_requests'):